@@ -16,50 +16,263 @@ __date__ = "2023-03-29"
 __version__ = "1.4.0"
 
 import argparse
+import atexit
 import configparser
-import csv
-import datetime as dt
-import glob
+import functools
 import json
 import os
 import pathlib
 import platform
 import re
 import shutil
+import stat
 import sys
+import threading
 import time
 import traceback
-import urllib.error
-import urllib.request
 import zipfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 import semver
-import wget
 from bs4 import BeautifulSoup
 from fpdf import FPDF, YPos, XPos
+from requests.adapters import HTTPAdapter
 from rich import print
+from rich.console import Console
 from rich.prompt import Prompt
+from urllib3.util.retry import Retry
+
+# Console pour le texte brut (changelogs) : pas d'analyse du markup ni de coloration automatique
+CONSOLE_TXT = Console(markup=False, highlight=False)
+
+# Session partagée pour réutiliser les connexions vers mods.vintagestory.at
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# Expressions régulières utilisées pour chaque mod
+# modinfo.json (les chaines sont capturées pour ne pas modifier leur contenu)
+RE_JSON_STRING = r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')'
+RE_JSON_SINGLE_QUOTED = re.compile(r'("(?:\\.|[^"\\])*")|\'((?:\\.|[^\'\\])*)\'')
+RE_JSON_DOUBLE_QUOTE = re.compile(r'\\?"')
+RE_JSON_COMMENT = re.compile(RE_JSON_STRING + r'|//[^\n]*|/\*.*?\*/', flags=re.DOTALL)
+RE_JSON_KEY = re.compile(RE_JSON_STRING + r'|([{,]\s*)([A-Za-z_]\w*)(\s*:)')
+RE_JSON_TRAILING_COMMA = re.compile(RE_JSON_STRING + r'|,(\s*[}\]])')
+# fichiers .cs
+RE_CS_NAME = re.compile(r'(namespace )(\w*)', flags=re.IGNORECASE)
+RE_CS_VERSION = re.compile(r'(Version\s=\s\")([\d.]*)\"', flags=re.IGNORECASE)
+RE_CS_DESCRIPTION = re.compile(r'Description = "(.*)",', flags=re.IGNORECASE)
+# versions et changelog
+RE_WHITESPACE = re.compile(r'\s')
+RE_MAX_VERSION = re.compile(r'v([\d.]*)([\W\w]*)')
+RE_VERSION_NUMBERS = re.compile(r'\d+')
+RE_LEADING_ZERO = re.compile(r'\b0(\d)\b')
+RE_BR = re.compile(r'</{0,1}br/{0,1}>')
+RE_P = re.compile(r'</{0,1}p>')
+RE_FIRST_NEWLINE = re.compile(r'[\n]^')
+RE_LAST_NEWLINE = re.compile(r'[\n]$')
+RE_CARSPE = re.compile(r'^[\W*]*')
+# nom du fichier donné par le serveur lors du téléchargement
+RE_CONTENT_DISPOSITION = re.compile(r'filename\s*=\s*"?([^";]+)"?', flags=re.IGNORECASE)
+
+# On récupère le system une seule fois, avec ce qui en dépend (variables d'environnement lues au lancement)
+my_os = platform.system()
+if my_os == 'Windows':
+    VAR_ENV = os.getenv('appdata')
+    PATH_MODS_DEFAULT = Path(VAR_ENV, 'VintagestoryData', 'Mods') if VAR_ENV else None
+    RE_PATH_MODS = re.compile(r'(%APPDATA%)(.*)', flags=re.IGNORECASE)
+    URL_SCRIPT = 'https://mods.vintagestory.at/modsupdater#tab-files'
+elif my_os == 'Linux':
+    VAR_ENV = os.getenv('HOME')
+    PATH_MODS_DEFAULT = Path(Path.home(), '.config', 'VintagestoryData', 'Mods')
+    RE_PATH_MODS = re.compile(r'(HOME)(.*)', flags=re.IGNORECASE)
+    URL_SCRIPT = 'https://mods.vintagestory.at/modsupdaterforlinux#tab-files'
+else:
+    VAR_ENV = None
+    PATH_MODS_DEFAULT = None
+    RE_PATH_MODS = None
+    URL_SCRIPT = ''
+
+# Fichier de config, dossiers de travail, dossier des langues et langue par défaut
+# (le dossier courant ne change pas pendant l'exécution, il n'est lu qu'une fois)
+PATH_CONFIG_FILE = Path(Path.cwd(), 'config.ini')
+PATH_LOGS = Path('logs')
+PATH_TEMP = Path('temp')
+PATH_LANG = Path('lang')
+DEFAULT_LANG_FILE = Path(PATH_LANG, 'en_US.json')
+
+# Durée de validité (en secondes) des réponses de ModDB gardées en cache
+CACHE_EXPIRE_API = 60
+CACHE_EXPIRE_CHANGELOG = 3600
+
+
+# Crée le dossier (et ses parents) si besoin et renvoie son chemin
+def ensure_dir(path):
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# Fichiers d'un dossier ayant l'une des extensions données, en un seul passage
+# (scandir donne le type de chaque entrée, sans stat par fichier)
+def list_files(path, extensions):
+    with os.scandir(path) as it:
+        return [entry for entry in it if entry.name.endswith(extensions) and entry.is_file()]
+
+
+# Dossiers de travail : chemin construit et dossier créé une seule fois par exécution
+@functools.lru_cache(maxsize=None)
+def get_logs_path():
+    return ensure_dir(PATH_LOGS)
+
+
+@functools.lru_cache(maxsize=None)
+def get_temp_path():
+    return ensure_dir(PATH_TEMP)
+
+
+def clear_temp_folder():
+    # On efface le dossier temp (il sera recréé au prochain get_temp_path)
+    shutil.rmtree(PATH_TEMP, ignore_errors=True)
+    get_temp_path.cache_clear()
+
+
+# Test de config.ini en un seul os.stat (un fichier vide, écriture interrompue, est supprimé pour refaire la config)
+def config_file_exists(config_file):
+    try:
+        config_stat = os.stat(config_file)
+    except FileNotFoundError:
+        return False
+    if not stat.S_ISREG(config_stat.st_mode):
+        return False
+    if config_stat.st_size == 0:
+        os.remove(config_file)
+        return False
+    return True
+
+
+# Creation of a logfile (opened on the first message and kept open until the end of the script)
+class DebugLog:
+    __slots__ = ('log_file', 'lock')
+
+    def __init__(self):
+        self.log_file = None
+        self.lock = threading.Lock()
+
+    def write(self, info_crash):
+        with self.lock:
+            if self.log_file is None:
+                log_path = Path(get_logs_path(), f'debug-log-{time.strftime("%Y%m%d%H%M%S")}.txt')
+                self.log_file = open(log_path, 'a', encoding='UTF-8')
+                atexit.register(self.log_file.close)
+            self.log_file.write(f'{time.strftime("%Y-%m-%d %H:%M:%S")} : {info_crash}\n')
+            self.log_file.flush()
+
+
+debug_log = DebugLog()
 
 
-# Creation of a logfile
 def write_log(info_crash):
     print(f'An error occured. Please see the debug-log file in logs folder for more information.')
-    if not Path('logs').is_dir():
-        os.mkdir('logs')
-    log_path = Path('logs').joinpath(f'debug-log-{dt.datetime.today().strftime("%Y%m%d%H%M%S")}.txt')
-    with open(log_path, 'a', encoding='UTF-8') as crashlog_file:
-        crashlog_file.write(f'{dt.datetime.today().strftime("%Y-%m-%d %H:%M:%S")} : {info_crash}\n')
+    debug_log.write(info_crash)
+
+
+# Message d'erreur dans la langue choisie, le détail va dans le log
+def log_error(msg_error):
+    print(f'[red]{lang.error_msg}[/red]')
+    write_log(msg_error)
+
+
+# Les mêmes versions reviennent d'un mod à l'autre, on garde les résultats en mémoire
+@functools.lru_cache(maxsize=4096)
+def semver_compare(ver1, ver2):
+    return semver.compare(ver1, ver2)
+
+
+@functools.lru_cache(maxsize=4096)
+def semver_parse(version):
+    return semver.Version.parse(version)
+
+
+class HttpCache:
+    # Cache sur disque des réponses de ModDB, chaque entrée garde l'heure à laquelle elle a été récupérée et sa durée de validité
+    def __init__(self, cache_file, enabled=True):
+        self.cache_file = Path(cache_file)
+        self.enabled = enabled
+        self.content = {}
+        if self.enabled and os.path.isfile(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as cache_json:
+                    now = time.time()
+                    # On ne garde que les entrées encore valides ([heure, durée, donnée])
+                    self.content = {url: entry for url, entry in json.load(cache_json).items() if len(entry) == 3 and now - entry[0] < entry[1]}
+            except (OSError, ValueError, TypeError, KeyError, AttributeError):
+                self.content = {}  # Cache illisible, il sera recréé
+
+    def get(self, url):
+        # On renvoie la donnée en cache si elle est encore valide, sinon None
+        entry = self.content.get(url)
+        if self.enabled and entry is not None and time.time() - entry[0] < entry[1]:
+            return entry[2]
+        return None
+
+    def set(self, url, data, expire_after):
+        # La donnée reste valide expire_after secondes
+        if self.enabled:
+            self.content[url] = [time.time(), expire_after, data]
+
+    def save(self):
+        # On enregistre le cache sans les entrées expirées
+        if not self.enabled:
+            return
+        now = time.time()
+        self.content = {url: entry for url, entry in self.content.items() if now - entry[0] < entry[1]}
+        ensure_dir(self.cache_file.parent)
+        with open(self.cache_file, 'w', encoding='utf-8') as cache_json:
+            json.dump(self.content, cache_json)
+
+
+class LangFile(dict):
+    # Contenu d'un fichier de langue : une clé absente de la traduction est prise dans en_US.json (lu seulement si besoin)
+    def __init__(self, file_lang_path):
+        # Lu en une fois, json gère le BOM éventuel
+        super().__init__(json.loads(file_lang_path.read_bytes()))
+        self.file_lang_path = file_lang_path
+
+    def __missing__(self, key):
+        if self.file_lang_path == DEFAULT_LANG_FILE:
+            raise KeyError(key)
+        return load_default_lang()[key]
+
+
+# en_US.json est lu une seule fois pour tout le script, et seulement si on en a besoin
+@functools.lru_cache(maxsize=1)
+def load_default_lang():
+    return LangFile(DEFAULT_LANG_FILE)
 
 
 class LanguageChoice:
+    # Données fixes, construites une seule fois pour toutes les instances
+    url_mods = 'https://mods.vintagestory.at/'
+    # Dico pour les langues - Region, langue-abr, langue, index
+    dic_lang = {
+        "DE": ["de", "Deutsch", '1'],
+        "US": ["en", "English", '2'],
+        "ES": ["es", "Español", '3'],
+        "FR": ["fr", "Français", '4'],
+        "IT": ["it", "Italiano", '5'],
+        "BR": ["pt", "Português", '6'],
+        "RU": ["ru", "Русский", '7'],
+        "UA": ["uk", "Українська", '8']
+    }
+    # Accès direct à une langue par son index dans le menu
+    dic_lang_index = {lang_ext[2]: (region, lang_ext) for region, lang_ext in dic_lang.items()}
+    list_lang_choice = list(dic_lang_index)
+
     def __init__(self):
-        self.url_mods = 'https://mods.vintagestory.at/'
-        self.path_lang = Path("lang")
+        self.path_lang = PATH_LANG
         # Si on définit manuellement la langue via le fichier config
-        self.config_file = Path('config.ini')
+        self.config_file = PATH_CONFIG_FILE
         self.config_read = configparser.ConfigParser(allow_no_value=True, interpolation=None)
         self.config_read.read(self.config_file, encoding='utf-8-sig')
         # On vérifie si args.language existe
@@ -74,92 +287,77 @@ class LanguageChoice:
             except (configparser.NoOptionError, configparser.NoSectionError):
                 self.lang = 'en_US.json'
         self.file_lang_path = Path(self.path_lang, self.lang)
-        if not self.file_lang_path.is_file():
-            self.file_lang_path = Path(self.path_lang, 'en_US.json')  # on charge en.json si aucun fichier de langue n'est présent
-        # On charge le fichier de langue
-        with open(self.file_lang_path, "r", encoding='utf-8-sig') as lang_json:
-            desc = json.load(lang_json)
-            self.setconfig = desc['setconfig']
-            self.setconfig01 = desc['setconfig01']
-            self.datapath = desc['datapath']
-            self.title = desc['title']
-            self.title2 = desc['title2']
-            self.version_max = desc['version_max']
-            self.author = desc['author']
-            self.first_launch_title = desc['first_launch_title']
-            self.first_launch_lang_choice = desc['first_launch_lang_choice']
-            self.first_launch_config_done = desc['first_launch_config_done']
-            self.first_launch_pathmods = desc['first_launch_pathmods']
-            self.first_launch_lang_txt = desc['first_launch_lang_txt']
-            self.first_launch_game_ver_max = desc['first_launch_game_ver_max']
-            self.first_launch2 = desc['first_launch2']
-            self.first_launch3 = desc['first_launch3']
-            self.err_list = desc['err_list']
-            self.compver1 = desc['compver1']
-            self.compver2 = desc['compver2']
-            self.compver3 = desc['compver3']
-            self.compver3a = desc['compver3a']
-            self.compver4 = desc['compver4']
-            self.summary1 = desc['summary1']
-            self.summary2 = desc['summary2']
-            self.summary3 = desc['summary3']
-            self.summary4 = desc['summary4']
-            self.summary5 = desc['summary5']
-            self.summary6 = desc['summary6']
-            self.summary7 = desc['summary7']
-            self.error_modid = desc['error_modid']
-            self.error = desc['error']
-            self.last_update = desc['last_update']
-            self.yes = desc['yes']
-            self.no = desc['no']
-            self.existing_update = desc['existing_update']
-            self.exiting_script = desc['exiting_script']
-            self.language_comment = desc['language']
-            self.makePDFTitle = desc['makePDFTitle']
-            self.makepdf = desc['makePDF']
-            self.addingmodsinprogress = desc['addingmodsinprogress']
-            self.makingpdfended = desc['makingpdfended']
-            self.pdfTitle = desc['pdfTitle']
-            self.ErrorCreationPDF = desc['ErrorCreationPDF']
-            self.end_of_prg = desc['end_of_prg']
-            self.error_msg = desc['error_msg']
+        # On charge le fichier de langue (ouverture directe, sans test préalable du fichier)
+        try:
+            desc = LangFile(self.file_lang_path)
+        except FileNotFoundError:
+            self.file_lang_path = DEFAULT_LANG_FILE  # on charge en.json si aucun fichier de langue n'est présent
+            desc = load_default_lang()
+        self.setconfig = desc['setconfig']
+        self.setconfig01 = desc['setconfig01']
+        self.datapath = desc['datapath']
+        self.title = desc['title']
+        self.title2 = desc['title2']
+        self.version_max = desc['version_max']
+        self.author = desc['author']
+        self.first_launch_title = desc['first_launch_title']
+        self.first_launch_lang_choice = desc['first_launch_lang_choice']
+        self.first_launch_config_done = desc['first_launch_config_done']
+        self.first_launch_pathmods = desc['first_launch_pathmods']
+        self.first_launch_lang_txt = desc['first_launch_lang_txt']
+        self.first_launch_game_ver_max = desc['first_launch_game_ver_max']
+        self.first_launch2 = desc['first_launch2']
+        self.first_launch3 = desc['first_launch3']
+        self.err_list = desc['err_list']
+        self.compver1 = desc['compver1']
+        self.compver2 = desc['compver2']
+        self.compver3 = desc['compver3']
+        self.compver3a = desc['compver3a']
+        self.compver4 = desc['compver4']
+        self.summary1 = desc['summary1']
+        self.summary2 = desc['summary2']
+        self.summary3 = desc['summary3']
+        self.summary4 = desc['summary4']
+        self.summary5 = desc['summary5']
+        self.summary6 = desc['summary6']
+        self.summary7 = desc['summary7']
+        self.error_modid = desc['error_modid']
+        self.error = desc['error']
+        self.last_update = desc['last_update']
+        self.yes = desc['yes']
+        self.no = desc['no']
+        self.existing_update = desc['existing_update']
+        self.exiting_script = desc['exiting_script']
+        self.language_comment = desc['language']
+        self.makePDFTitle = desc['makePDFTitle']
+        self.makepdf = desc['makePDF']
+        self.addingmodsinprogress = desc['addingmodsinprogress']
+        self.makingpdfended = desc['makingpdfended']
+        self.pdfTitle = desc['pdfTitle']
+        self.ErrorCreationPDF = desc['ErrorCreationPDF']
+        self.end_of_prg = desc['end_of_prg']
+        self.error_msg = desc['error_msg']
+        self.download_failed = desc['download_failed']
 
         # On crée une liste pour les réponses O/N
         self.list_yesno = [self.yes.lower(), self.no.lower(), self.yes[0].lower(), self.no[0].lower()]
-        # Dico pour les langues - Region, langue-abr, langue, index
-        self.dic_lang = {
-            "DE": ["de", "Deutsch", '1'],
-            "US": ["en", "English", '2'],
-            "ES": ["es", "Español", '3'],
-            "FR": ["fr", "Français", '4'],
-            "IT": ["it", "Italiano", '5'],
-            "BR": ["pt", "Português", '6'],
-            "RU": ["ru", "Русский", '7'],
-            "UA": ["uk", "Українська", '8']
-        }
+        self.set_yes = frozenset(self.list_yesno[0::2])
+        self.set_no = frozenset(self.list_yesno[1::2])
 
 
 class MajScript:
     def __init__(self):
         # Version du script pour affichage titre.
         super().__init__()
-        # system
-        self.my_os = platform.system()
 
     def check_update_script(self):
         # Scrap pour recuperer la derniere version en ligne du script
-        if self.my_os == "Windows":
-            url_script = 'https://mods.vintagestory.at/modsupdater#tab-files'
-        elif self.my_os == 'Linux':
-            url_script = 'https://mods.vintagestory.at/modsupdaterforlinux#tab-files'
-        else:
-            url_script = ''
-        req_url_script = urllib.request.Request(url_script)
+        url_script = URL_SCRIPT
         try:
-            urllib.request.urlopen(req_url_script)
-            req_page_url = requests.get(url_script, timeout=2)
+            req_page_url = SESSION.get(url_script, timeout=2)
+            req_page_url.raise_for_status()  # On teste l'existence du lien
             page = req_page_url.content
-            soup = BeautifulSoup(page, features="html.parser")
+            soup = BeautifulSoup(page, features="lxml")
             soup_changelog = soup.find("div", {"class": "changelogtext"})
             soup_link_prg = soup.find("a", {"class": "downloadbutton"})
             # on recupere la version du chanlog
@@ -169,91 +367,79 @@ class MajScript:
             result = VSUpdate.compversion_local(__version__, online_ver_modsupdater[1])
             if result == -1:
                 column, row = os.get_terminal_size()
-                maj_txt = f'[red]{LanguageChoice().existing_update}[/red]{LanguageChoice().url_mods.rstrip("/")}{soup_link_prg["href"]}'
+                maj_txt = f'[red]{lang.existing_update}[/red]{lang.url_mods.rstrip("/")}{soup_link_prg["href"]}'
                 lines_update = maj_txt.splitlines()
                 for line in lines_update:
                     print(f'{line.center(column)}')
         except requests.exceptions.ReadTimeout:
             write_log('ReadTimeout error: Server did not respond within the specified timeout.')
-        except urllib.error.URLError as err_url:
+        except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err_url:
             # Affiche de l'erreur si le lien n'est pas valide
-            print(f'[red]{LanguageChoice().error_msg}[/red]')
-            msg_error = f'{err_url.reason} : {url_script}'
-            write_log(msg_error)
+            log_error(f'{err_url} : {url_script}')
 
 
 class VSUpdate:
     def __init__(self, pathmods):
+        global lang
         # ##### Version du script pour affichage titre.
         super().__init__()
         # #####
         # Définition des chemins
-        self.config_file = Path('config.ini')
-        self.path_temp = Path("temp")
-        self.path_logs = Path("logs")
-        self.path_mods = Path(pathmods)
+        self.config_file = PATH_CONFIG_FILE
+        self.path_temp = get_temp_path()
+        self.path_mods = Path(pathmods)  # déjà résolu (argument ou config.ini) et vérifié avant la création de VSUpdate
         self.url_api = 'https://mods.vintagestory.at/api/mod/'
-        self.crashlog_path = Path('logs').joinpath('crash-log.txt')
+        self.http_cache = HttpCache(Path('cache', 'http_cache.json'), enabled=args.nocache == 'false')
         self.lang_name = ''
-        # Creation des dossiers et fichiers
-        if not self.path_temp.is_dir():
-            os.mkdir('temp')
+        self.config_read = configparser.ConfigParser(allow_no_value=True, interpolation=None)
+        # On charge directement config.ini (déjà vérifié au lancement) : s'il n'a pu être lu, c'est le 1er lancement
+        config_ok = self.config_read.read(self.config_file, encoding='utf-8-sig')
         # On crée le fichier config.ini si inexistant, puis (si lancement du script via l'executable et non en ligne de commande) on sort du programme si on veut ajouter des mods à exclure
-        if not self.config_file.is_file():
+        if not config_ok:
             if args.nopause == 'false':
-                print(f'\n\t\t[bold cyan]{LanguageChoice().first_launch_title}[/bold cyan]\n')
+                print(f'\n\t\t[bold cyan]{lang.first_launch_title}[/bold cyan]\n')
                 i = 1
-                for lan_2L, item in LanguageChoice().dic_lang.items():
+                for lan_2L, item in lang.dic_lang.items():
                     print(f'\t\t - {i}) {item[1]}, {item[0]}')
                     i += 1
             if args.nopause == 'false':
-                lang_choice_result = Prompt.ask(f'\n\t\t[bold cyan]{LanguageChoice().first_launch_lang_choice}[/bold cyan]', choices=['1', '2', '3', '4', '5', '6', '7', '8'], show_choices=False, default='2')
-                for region, lang_ext in LanguageChoice().dic_lang.items():
-                    if lang_choice_result == lang_ext[2]:
-                        self.file_lang_path = f'lang\{lang_ext[0]}_{region}.json'
-                        self.lang_name = lang_ext[1]
+                lang_choice_result = Prompt.ask(f'\n\t\t[bold cyan]{lang.first_launch_lang_choice}[/bold cyan]', choices=lang.list_lang_choice, show_choices=False, default='2')
+                region, lang_ext = lang.dic_lang_index[lang_choice_result]
+                self.file_lang_path = f'lang\{lang_ext[0]}_{region}.json'
+                self.lang_name = lang_ext[1]
             else:
                 if args.language:
                     self.file_lang_path = f'lang\{args.language}.json'
-                    for region, lang_ext in LanguageChoice().dic_lang.items():
-                        # On récupere le nom de la langue
-                        if region == args.language.split('_')[1]:
-                            self.lang_name = lang_ext[1]
+                    # On récupere le nom de la langue
+                    region = args.language.split('_')[1]
+                    if region in lang.dic_lang:
+                        self.lang_name = lang.dic_lang[region][1]
                 else:
                     self.file_lang_path = f'lang\en_US.json'
                     self.lang_name = 'English'
             # On crée le fichier config.ini
             self.set_config_ini()
+            # On recharge la langue choisie
+            lang = LanguageChoice()
             # On récupère les valeurs de config.ini
-            self.config_read = configparser.ConfigParser(allow_no_value=True, interpolation=None)
             self.config_read.read(self.config_file, encoding='utf-8-sig')
             self.force_update = self.config_read.get('ModsUpdater', 'force_update')  # On récupère la valeur de force_update
             self.disable_mod_dev = self.config_read.get('ModsUpdater', 'disable_mod_dev')  # On récupère l'option pour la maj ou non des version dev des mod.
-            print(f'\n\t[bold cyan]{LanguageChoice().first_launch_config_done}[/bold cyan] :')
-            print(f'\t\t- [bold cyan]{LanguageChoice().first_launch_lang_txt}[/bold cyan] : {self.lang_name}')
-            print(f'\t\t- [bold cyan]{LanguageChoice().first_launch_pathmods} : {self.path_mods}[/bold cyan]')
-            print(f'\t\t- [bold cyan]{LanguageChoice().first_launch_game_ver_max}[/bold cyan]')
+            print(f'\n\t[bold cyan]{lang.first_launch_config_done}[/bold cyan] :')
+            print(f'\t\t- [bold cyan]{lang.first_launch_lang_txt}[/bold cyan] : {self.lang_name}')
+            print(f'\t\t- [bold cyan]{lang.first_launch_pathmods} : {self.path_mods}[/bold cyan]')
+            print(f'\t\t- [bold cyan]{lang.first_launch_game_ver_max}[/bold cyan]')
             print(f'\t\t- [bold cyan]force_Update : {self.force_update}[/bold cyan]')
             print(f'\t\t- [bold cyan]disable_mod_dev : {self.disable_mod_dev}[/bold cyan]')
             # On demande de continuer ou on quitte
             if args.nopause == 'false':
-                print(f'\n\t[bold cyan]{LanguageChoice().first_launch2}[/bold cyan]')
-                maj_ok = Prompt.ask(f'\n\t{LanguageChoice().first_launch3}', choices=[LanguageChoice().list_yesno[0], LanguageChoice().list_yesno[1], LanguageChoice().list_yesno[2], LanguageChoice().list_yesno[3]])
-                if maj_ok == LanguageChoice().list_yesno[1] or maj_ok == LanguageChoice().list_yesno[3]:
+                print(f'\n\t[bold cyan]{lang.first_launch2}[/bold cyan]')
+                maj_ok = Prompt.ask(f'\n\t{lang.first_launch3}', choices=lang.list_yesno)
+                if maj_ok in lang.set_no:
                     print(f'{lang.end_of_prg} ')
-                    if Path('temp').is_dir():
-                        shutil.rmtree('temp')
+                    clear_temp_folder()
                     time.sleep(2)
                     sys.exit()
-
-        # On charge le fichier config.ini
-        self.config_read = configparser.ConfigParser(allow_no_value=True, interpolation=None)
-        self.config_read.read(self.config_file, encoding='utf-8-sig')
-        if not args.modspath:
-            self.config_path = Path(self.config_read.get('ModPath', 'path'))
-            self.path_mods = Path(self.config_path)
-        else:
-            self.path_mods = arg_modspath()
         # Définition des listes
         self.mod_filename = []
         self.mod_name_list = []
@@ -263,41 +449,26 @@ class VSUpdate:
         self.liste_mod_maj_filename = []
         # Définition des dico
         self.mods_updated = {}
+        self.modinfo_cache = {}  # Infos de modinfo.json déjà extraites, par fichier
+        self.modinfo_extractors = {'.zip': self.extract_modinfo_zip, '.cs': self.extract_modinfo_cs}
         # Définition des variables
         self.modename = None
         self.nb_maj = 0
         self.gamever_limit = self.config_read.get('Game_Version_max', 'version')  # On récupère la version max du jeu pour la maj
+        # Les options sont converties une seule fois en booléens pour la boucle de maj
         if args.forceupdate:  # On récupère la valeur de force_update
-            self.force_update = args.forceupdate
+            self.force_update = args.forceupdate == 'true'
         else:
-            self.force_update = self.config_read.get('ModsUpdater', 'force_update')
+            self.force_update = self.config_read.get('ModsUpdater', 'force_update').lower() == 'true'
         if args.disable_mod_dev:
-            self.disable_mod_dev = args.disable_mod_dev
+            self.disable_mod_dev = args.disable_mod_dev != 'false'
         else:
-            self.disable_mod_dev = self.config_read.get('ModsUpdater', 'disable_mod_dev')
-        self.modinfo_content = None
+            self.disable_mod_dev = self.config_read.get('ModsUpdater', 'disable_mod_dev') != 'false'
         self.version_locale = ''
         self.mod_last_version_online = ''
         self.user_language = ''
-        # variables json_correction
-        self.name_json = ''
-        self.version_json = ''
-        self.modid_json = ''
-        self.moddesc_json = ''
-        self.regex_name_json = ''
-        self.result_name_json = ''
-        self.regex_version_json = ''
-        self.result_version_json = ''
-        self.regex_modid_json = ''
-        self.result_modid_json = ''
-        self.regex_moddesc_json = ''
-        self.result_moddesc_json = ''
-        # variables extract_modinfo
-        self.filepath = ''
         # Accueil
         self.version = ''
-        # Update_mods
-        self.Path_Changelog = ''
         # config_file
         self.exclusion_size = None
 
@@ -307,7 +478,7 @@ class VSUpdate:
             # Ajout du contenu
             config = configparser.ConfigParser(allow_no_value=True, interpolation=None)
             mu_ver = __version__
-            my_system = platform.system()
+            my_system = my_os
             config.add_section('ModsUpdater')
             config.set('ModsUpdater', '# Info about the creation of the config.ini file')
             config.set('ModsUpdater', 'ver', mu_ver)
@@ -319,7 +490,7 @@ class VSUpdate:
             config.add_section('ModPath')
             config.set('ModPath', 'path', str(self.path_mods))
             config.add_section('Language')
-            config.set('Language', str(LanguageChoice().language_comment))
+            config.set('Language', str(lang.language_comment))
             #  Si l'argument lang a été transmis
             if args.language:
                 config.set('Language', 'language', args.language)  # from command line
@@ -328,10 +499,10 @@ class VSUpdate:
                 resul_lang = re.search(regex_lang, str(self.file_lang_path))
                 config.set('Language', 'language', resul_lang[1])
             config.add_section('Game_Version_max')
-            config.set('Game_Version_max', LanguageChoice().setconfig01)
+            config.set('Game_Version_max', lang.setconfig01)
             config.set('Game_Version_max', 'version', '100.0.0')
             config.add_section('Mod_Exclusion')
-            config.set('Mod_Exclusion', LanguageChoice().setconfig)
+            config.set('Mod_Exclusion', lang.setconfig)
             if args.exclusion:
                 for i in range(0, len(args.exclusion)):
                     config.set('Mod_Exclusion', 'mod' + str(i+1), args.exclusion[i])
@@ -340,134 +511,111 @@ class VSUpdate:
                     config.set('Mod_Exclusion', 'mod' + str(i), '')
             config.write(cfgfile)
 
-    def json_correction(self, txt_json):
-        self.regex_name_json = r'"{0,1}name"{0,1} {0,}: {0,}"(.*)",{0,}'
-        self.result_name_json = re.search(self.regex_name_json, txt_json, flags=re.IGNORECASE)
-        self.regex_version_json = r'"{0,1}version"{0,1} {0,}: {0,}"(.*)",{0,}'
-        self.result_version_json = re.search(self.regex_version_json, txt_json, flags=re.IGNORECASE)
-        self.regex_modid_json = r'"{0,1}modid"{0,1} {0,}: {0,}"(.*)",{0,}'
-        self.result_modid_json = re.search(self.regex_modid_json, txt_json, flags=re.IGNORECASE)
-        self.regex_moddesc_json = r'"{0,1}description"{0,1} {0,}: {0,}"(.*)",{0,}'
-        self.result_moddesc_json = re.search(self.regex_moddesc_json, txt_json, flags=re.IGNORECASE)
-        if self.result_name_json:
-            self.name_json = self.result_name_json.group(2)
-        if self.result_version_json:
-            self.version_json = self.result_version_json.group(2)
-        if self.result_modid_json:
-            self.modid_json = self.result_modid_json.group(2)
-        if self.result_moddesc_json:
-            self.moddesc_json = self.result_moddesc_json.group(2)
-        print(f'self.name_json:{self.name_json}\nself.version_json:{self.version_json}\nself.modid_json:{self.modid_json}\nself.moddesc_json:{self.moddesc_json}')
-        return self.name_json, self.version_json, self.modid_json, self.moddesc_json
+    @staticmethod
+    def parse_modinfo(txt_json):
+        # On lit modinfo.json en tolérant les libertés acceptées par le jeu (commentaires, chaines entre '', clés sans "", virgules finales)
+        try:
+            modinfo = json.loads(txt_json, strict=False)
+        except json.JSONDecodeError:
+            txt_json = RE_JSON_COMMENT.sub(lambda m: m.group(1) or '', txt_json)
+            txt_json = RE_JSON_SINGLE_QUOTED.sub(lambda m: m.group(1) or '"' + RE_JSON_DOUBLE_QUOTE.sub(r'\\"', m.group(2).replace("\\'", "'")) + '"', txt_json)
+            txt_json = RE_JSON_KEY.sub(lambda m: m.group(1) or f'{m.group(2)}"{m.group(3)}"{m.group(4)}', txt_json)
+            txt_json = RE_JSON_TRAILING_COMMA.sub(lambda m: m.group(1) or m.group(2), txt_json)
+            modinfo = json.loads(txt_json, strict=False)
+        # Les clés ne sont pas sensibles à la casse
+        return {key.lower(): value for key, value in modinfo.items()}
+
+    def extract_modinfo_zip(self, file, filepath):
+        # On lit le fichier modinfo.json de l'archive
+        # (une erreur sur un fichier ne doit pas interrompre la lecture des autres mods)
+        try:
+            with zipfile.ZipFile(filepath) as fichier_zip:
+                modinfo_content = fichier_zip.read('modinfo.json').decode('utf-8-sig')
+        except KeyError:  # Pas de modinfo.json : ce n'est pas un mod
+            return None
+        except Exception:  # Zip corrompu ou illisible : le mod est ignoré
+            log_error(f'{file} :\n\n\t {traceback.format_exc()}')
+            return None
+        return self.modinfo_values(file, modinfo_content)
+
+    def modinfo_values(self, file, modinfo_content):
+        # On recupere le modid, name et version du contenu de modinfo.json (None si illisible, le mod est alors ignoré)
+        try:
+            modinfo = self.parse_modinfo(modinfo_content)
+            mod_name = modinfo['name']
+            if 'modid' in modinfo:
+                mod_modid = modinfo['modid']
+            else:
+                mod_modid = mod_name.replace(" ", "").lower()
+            mod_version = modinfo['version']
+            mod_description = modinfo.get('description', '')
+        except Exception:
+            log_error(f'{file} :\n\n\t {traceback.format_exc()}')
+            return None
+        return mod_name, mod_modid, mod_version, mod_description
+
+    @staticmethod
+    def extract_modinfo_cs(file, filepath):
+        # On recupere le name, la version et la description dans le code du mod
+        with open(filepath, "r", encoding='utf-8-sig') as fichier_cs:
+            cs_file = fichier_cs.read()
+        result_name = RE_CS_NAME.search(cs_file)
+        result_version = RE_CS_VERSION.search(cs_file)
+        result_description = RE_CS_DESCRIPTION.search(cs_file)
+        mod_name = result_name[2]
+        mod_version = result_version[2]
+        mod_modid = mod_name
+        mod_description = result_description[1]
+        return mod_name, mod_modid, mod_version, mod_description
 
     def extract_modinfo(self, file):
-        # On trie les fichiers .zip et .cs
-        type_file = Path(file).suffix
-        if type_file == '.zip':
-            # On lit le fichier modinfo.json de l'archive et on recupere le modid, name et version
-            self.filepath = Path(self.path_mods, file)
-            if zipfile.is_zipfile(self.filepath):  # Vérifie si fichier est un Zip valide
-                with zipfile.ZipFile(self.filepath) as fichier_zip:
-                    with fichier_zip.open('modinfo.json') as modinfo_json:
-                        self.modinfo_content = modinfo_json.read().decode('utf-8-sig')
-            try:
-                regex_name = r'"{0,1}name"{0,1} {0,}: {0,}"(.*)",{0,}'
-                result_name = re.search(regex_name, self.modinfo_content, flags=re.IGNORECASE)
-                regex_modid = r'"{0,1}modid"{0,1} {0,}: {0,}"(.*)",{0,}'
-                result_modid = re.search(regex_modid, self.modinfo_content, flags=re.IGNORECASE)
-                regex_version = r'"{0,1}version"{0,1} {0,}: {0,}"(.*)",{0,}'
-                result_version = re.search(regex_version, self.modinfo_content, flags=re.IGNORECASE)
-                regex_description = r'"{0,1}description"{0,1} {0,}: {0,}"(.*)",{0,}'
-                result_description = re.search(regex_description, self.modinfo_content, flags=re.IGNORECASE)
-                mod_name = result_name.group(1)
-                if result_modid is not None:
-                    mod_modid = result_modid.group(1)
-                else:
-                    mod_modid = mod_name.replace(" ", "").lower()
-                mod_version = result_version.group(1)
-                if result_description is not None:
-                    mod_description = result_description.group(1)
-                else:
-                    mod_description = ''
-            except Exception:
-                try:
-                    json_correct = self.json_correction(self.modinfo_content)
-                    mod_name = json_correct[0]
-                    mod_version = json_correct[1]
-                    mod_modid = json_correct[2]
-                    if json_correct[3] is not None:
-                        mod_description = json_correct[3]
-                    else:
-                        mod_description = ''
-                except Exception:
-                    print(f'[red]{LanguageChoice().error_msg}[/red]')
-                    msg_error = f'{file} :\n\n\t {traceback.format_exc()}'
-                    write_log(msg_error)
-                print(f'[red]{LanguageChoice().error_msg}[/red]')
-                msg_error = f'{file} :\n\n\t {traceback.format_exc()}'
-                write_log(msg_error)
-        elif type_file == '.cs':
-            self.filepath = Path(self.path_mods, file)
-            with open(self.filepath, "r", encoding='utf-8-sig') as fichier_cs:
-                cs_file = fichier_cs.read()
-                regexp_name = '(namespace )(\w*)'
-                result_name = re.search(regexp_name, cs_file, flags=re.IGNORECASE)
-                regexp_version = '(Version\s=\s\")([\d.]*)\"'
-                result_version = re.search(regexp_version, cs_file, flags=re.IGNORECASE)
-                regexp_description = 'Description = "(.*)",'
-                result_description = re.search(regexp_description, cs_file, flags=re.IGNORECASE)
-                mod_name = result_name[2]
-                mod_version = result_version[2]
-                mod_modid = mod_name
-                mod_description = result_description[1]
-        return mod_name, mod_modid, mod_version, mod_description, self.filepath
+        # On ne relit pas un fichier déjà traité
+        if file in self.modinfo_cache:
+            return self.modinfo_cache[file]
+        # On lit les infos selon le type de fichier (.zip ou .cs), le chemin du fichier est gardé en str
+        filepath = os.path.join(self.path_mods, file)
+        modinfo_values = self.modinfo_extractors[os.path.splitext(file)[1]](file, filepath)
+        self.modinfo_cache[file] = None if modinfo_values is None else (*modinfo_values, filepath)
+        return self.modinfo_cache[file]
+
+    def read_zip_modinfo(self, elem):
+        # On renvoie les infos de modinfo.json, ou None si le zip n'est pas un mod ou est illisible
+        modinfo_values = self.extract_modinfo_zip(elem.name, elem.path)
+        if modinfo_values is None:
+            return elem.name, None
+        return elem.name, (*modinfo_values, elem.path)
 
     def liste_complete_mods(self):
-        # On crée la liste contenant les noms des fichiers zip des mods
-        for elem in self.path_mods.glob('*.zip'):
-            mod_zipfile = zipfile.ZipFile(elem, 'r')
-            with mod_zipfile:
-                try:  # On ajoute uniquement les fichiers zip qui sont des mods
-                    zipfile.ZipFile.getinfo(mod_zipfile, 'modinfo.json')
-                    self.mod_filename.append(elem.name)
-                except KeyError:
-                    pass
+        # Un seul passage dans le dossier pour les .zip et les .cs
+        mod_entries = list_files(self.path_mods, ('.zip', '.cs'))
+        # On crée la liste contenant les noms des fichiers zip des mods (les zip sont lus en parallèle)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            zip_entries = [entry for entry in mod_entries if entry.name.endswith('.zip')]
+            for mod_file, modinfo_values in executor.map(self.read_zip_modinfo, zip_entries):
+                # None est gardé en cache pour ne pas relire un zip illisible ou qui n'est pas un mod
+                self.modinfo_cache[mod_file] = modinfo_values
+                if modinfo_values is not None:  # On ajoute uniquement les fichiers zip qui sont des mods
+                    self.mod_filename.append(mod_file)
         # On ajoute les fichiers .cs
-        for elem_cs in self.path_mods.glob('*.cs'):
-            self.mod_filename.append(elem_cs.name)
+        self.mod_filename.extend(entry.name for entry in mod_entries if entry.name.endswith('.cs'))
         if len(self.mod_filename) == 0:
-            print(f"{LanguageChoice().err_list}")
+            print(f"{lang.err_list}")
             os.system("pause")
             sys.exit()
         return self.mod_filename
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def verif_formatversion(v1, v2):
-        new_ver1 = []
-        new_ver2 = []
-        ver1 = v1.split('.')
-        for elem in ver1:
-            if len(elem) == 2 and elem[0] == str(0):
-                new_ver1.append(elem[1:])
-            else:
-                new_ver1.append(elem)
-        version1 = f'{new_ver1[0]}.{new_ver1[1]}.{new_ver1[2]}'
-
-        ver2 = v2.split('.')
-        for elem in ver2:
-            if len(elem) == 2 and str(elem[0]) == str(0):
-                new_ver2.append(elem[1:])
-            else:
-                new_ver2.append(elem)
-        version2 = f'{new_ver2[0]}.{new_ver2[1]}.{new_ver2[2]}'
-        return version1, version2
+        # On retire le 0 initial des numéros à deux chiffres (ex: 1.05.2 -> 1.5.2)
+        return RE_LEADING_ZERO.sub(r'\1', v1), RE_LEADING_ZERO.sub(r'\1', v2)
 
     @staticmethod
     # Pour comparer la version locale et online
     def compversion_local(ver_loc, ver_online):  # (version locale, version online)
         compver = ''
         try:
-            compver = semver.compare(ver_loc, ver_online)
+            compver = semver_compare(ver_loc, ver_online)
         except Exception:
             write_log(traceback.format_exc())
         return compver
@@ -478,29 +626,88 @@ class VSUpdate:
         compver = ''
         try:
             ver = VSUpdate.verif_formatversion(first_min_ver, ver_locale)
-            compver = semver.compare(ver[0], ver[1])
+            compver = semver_compare(ver[0], ver[1])
         except Exception:
             write_log(traceback.format_exc())
         return compver
 
     @staticmethod
     def get_max_version(versions):  # uniquement versions stables
-        regexp_max_version = 'v([\d.]*)([\W\w]*)'
-        max_version = re.search(regexp_max_version, max(versions))
+        max_version = RE_MAX_VERSION.search(max(versions))
         max_version = max_version[1]
         return max_version
 
-    @staticmethod
-    def get_changelog(url):
-        # Scrap pour recuperer le changelog
-        req_url = urllib.request.Request(url)
+    def get_mod_api(self, mod_url_api):
+        # On récupère les infos du mod via l'API (ou le cache si la réponse est récente)
+        resp_dict = self.http_cache.get(mod_url_api)
+        if resp_dict is None:
+            req_page = SESSION.get(str(mod_url_api), timeout=2)
+            req_page.raise_for_status()  # On teste l'existence du lien
+            resp_mod = req_page.json()['mod']
+            # On ne garde que ce qui sert à la maj (assetid et dernière release)
+            resp_dict = {'mod': {'assetid': resp_mod['assetid'], 'releases': resp_mod['releases'][:1]}}
+            self.http_cache.set(mod_url_api, resp_dict, CACHE_EXPIRE_API)
+        return resp_dict
+
+    def download_mod(self, dl_link, mod_file_onlinepath, old_filepath):
+        # On télécharge le mod dans un fichier .part, mis à sa place seulement une fois complet
+        # On renvoie la taille et le nom du nouveau fichier
+        with SESSION.get(str(dl_link), stream=True, timeout=30) as resp:
+            resp.raise_for_status()
+            # Nom donné par le serveur (comme wget), sinon celui du lien de la release
+            result_filename = RE_CONTENT_DISPOSITION.search(resp.headers.get('Content-Disposition', ''))
+            if result_filename:
+                mod_filename = os.path.basename(result_filename[1].strip())
+            else:
+                mod_filename = Path(mod_file_onlinepath).name
+            new_filepath = os.path.join(self.path_mods, mod_filename)
+            part_filepath = f'{new_filepath}.part'
+            # Si le nom change, l'ancienne version est mise de côté avant de placer la nouvelle
+            backup_filepath = None
+            if os.path.normcase(os.path.abspath(old_filepath)) != os.path.normcase(os.path.abspath(new_filepath)):
+                backup_filepath = f'{old_filepath}.old'
+            file_size = 0
+            try:
+                with open(part_filepath, 'wb') as mod_file:
+                    for chunk in resp.iter_content(chunk_size=64 * 1024):
+                        mod_file.write(chunk)
+                        file_size += len(chunk)
+                # Échoue (PermissionError) si le jeu utilise encore l'ancienne version : rien n'a encore changé dans Mods
+                if backup_filepath:
+                    os.replace(old_filepath, backup_filepath)
+                try:
+                    os.replace(part_filepath, new_filepath)
+                except BaseException:
+                    if backup_filepath:
+                        os.replace(backup_filepath, old_filepath)  # On remet l'ancienne version
+                    raise
+            except BaseException:
+                # Téléchargement interrompu : on efface le fichier partiel, l'ancienne version reste en place
+                try:
+                    os.remove(part_filepath)
+                except OSError:
+                    pass
+                raise
+        # Une seule version du mod reste dans Mods, la copie de l'ancienne n'est plus utile
+        if backup_filepath:
+            try:
+                os.remove(backup_filepath)
+            except OSError:
+                write_log(f'{backup_filepath}\n{traceback.format_exc()}')
+        return file_size, mod_filename
+
+    def get_changelog(self, url):
+        # Scrap pour recuperer le changelog (ou le cache si la page a déjà été lue récemment)
+        log = self.http_cache.get(url)
+        if log is not None:
+            return log
         log = {}
         lst_log_desc = []
         try:
-            urllib.request.urlopen(req_url)
-            req_page_url = requests.get(url, timeout=2)
+            req_page_url = SESSION.get(url, timeout=2)
+            req_page_url.raise_for_status()
             page = req_page_url.content
-            soup = BeautifulSoup(page, features="html.parser")
+            soup = BeautifulSoup(page, features="lxml")
             soup_full_changelog = soup.find("div", {"class": "changelogtext"})
             # version
             last_version = soup_full_changelog.find('strong').text
@@ -510,56 +717,42 @@ class VSUpdate:
                 lst_log_desc.append(balise_ul.text)
             else:
                 # recherche des paragraphes, on remplace les balises <br>, </br>, <br/> par un saut de ligne \n
-                regexp_br = r'</{0,1}br/{0,1}>'
-                new_desc_log = re.sub(regexp_br, '\n', str(soup_full_changelog.p))
+                new_desc_log = RE_BR.sub('\n', str(soup_full_changelog.p))
                 # recherche des paragraphes, on remplace les balises </p> par un saut de ligne \n
-                regexp_p = r'</{0,1}p>'
-                new_desc_log_2 = re.sub(regexp_p, '\n', new_desc_log)
+                new_desc_log_2 = RE_P.sub('\n', new_desc_log)
                 # On supprime le tout premier \n
-                regex_final_desc_log_01 = r'[\n]^'
-                new_desc_log_3 = re.sub(regex_final_desc_log_01, '', new_desc_log_2)
+                new_desc_log_3 = RE_FIRST_NEWLINE.sub('', new_desc_log_2)
                 # On supprime le(s) dernier(s) \n en fin de chaine
-                regex_final_desc_log = r'[\n]$'
-                final_desc_log = re.sub(regex_final_desc_log, '', new_desc_log_3)
-                # on separe la chaine au niveau de \n pour avoir un élément par ligne
-                lst_log_desc = final_desc_log.split('\n')
-                # On nettoie la liste
-                for entry in lst_log_desc:
-                    if entry == '':  # On supprime les entrées vide la liste
-                        lst_log_desc.remove(entry)
-                # On retire les caratceres spéciaux en début de ligne si il y en a
-                for item in lst_log_desc:
-                    index_item = lst_log_desc.index(item)
-                    regex_carspe = r'^[\W*]*'
-                    new_item = re.sub(regex_carspe, '', item)
-                    lst_log_desc[int(index_item)] = new_item
+                final_desc_log = RE_LAST_NEWLINE.sub('', new_desc_log_3)
+                # on separe la chaine au niveau de \n pour avoir un élément par ligne, sans les lignes vides,
+                # et on retire les caratceres spéciaux en début de ligne si il y en a
+                lst_log_desc = [RE_CARSPE.sub('', line) for line in final_desc_log.split('\n') if line.strip()]
             # #######
             log[last_version] = lst_log_desc
             log['url'] = url
+            self.http_cache.set(url, log, CACHE_EXPIRE_CHANGELOG)
         except requests.exceptions.ReadTimeout:
             write_log('ReadTimeout error: Server did not respond within the specified timeout.')
-        except urllib.error.URLError as err_url:
+        except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err_url:
             # Affiche de l'erreur si le lien n'est pas valide
-            print(f'[red]{LanguageChoice().error_msg}[/red]')
-            msg_error = f'{err_url.reason} : {url}'
-            write_log(msg_error)
+            log_error(f'{err_url} : {url}')
         return log
 
     def accueil(self):  # le _ en debut permet de lever le message "Parameter 'net_version' value is not used
         if self.gamever_limit == '100.0.0':
-            self.version = LanguageChoice().version_max
+            self.version = lang.version_max
         else:
             self.version = self.gamever_limit
         # *** Texte d'accueil ***
         column, row = os.get_terminal_size()
-        txt_title01 = f'\n\n[bold cyan]{LanguageChoice().title} - v.{__version__} {LanguageChoice().author}[/bold cyan]'
+        txt_title01 = f'\n\n[bold cyan]{lang.title} - v.{__version__} {lang.author}[/bold cyan]'
         lines01 = txt_title01.splitlines()
         for line in lines01:
             print(line.center(column))
         # On vérifie si une version plus récente du script est en ligne
         maj_script = MajScript()
         maj_script.check_update_script()
-        txt_title02 = f'\n[cyan]{LanguageChoice().title2} : [bold]{self.version}[/bold][/cyan]\n'
+        txt_title02 = f'\n[cyan]{lang.title2} : [bold]{self.version}[/bold][/cyan]\n'
         lines02 = txt_title02.splitlines()
         for line in lines02:
             print(f'{line.center(column)}')
@@ -567,216 +760,206 @@ class VSUpdate:
 
     def mods_exclusion(self):
         # On crée la liste des mods à exclure de la maj
-        for j in range(1, len(self.config_read.options('Mod_Exclusion')) + 1):
-            try:
-                modfile = self.config_read.get('Mod_Exclusion', 'mod' + str(j))
-                if modfile != '':
-                    self.mods_exclu.append(modfile)
-                self.mods_exclu.sort()
-            except configparser.NoSectionError:
-                pass
-            except configparser.InterpolationSyntaxError as err_parsing:
-                print(f'[red]{LanguageChoice().error_msg}[/red]')
-                msg_error = f'Error in config.ini [Mod_Exclusion] - mod{str(j)} : {str(err_parsing)}'
-                write_log(msg_error)
-                sys.exit()
+        try:
+            self.mods_exclu = sorted(modfile for key, modfile in self.config_read.items('Mod_Exclusion') if key.startswith('mod') and modfile)
+        except configparser.NoSectionError:
+            pass
+        except configparser.InterpolationSyntaxError as err_parsing:
+            log_error(f'Error in config.ini [Mod_Exclusion] : {str(err_parsing)}')
+            sys.exit()
 
     def mods_list(self):
         # Création de la liste des mods à mettre à jour
         # On retire les mods de la liste d'exclusion
-        self.liste_mod_maj_filename = self.liste_complete_mods()
-        for modexclu in self.mods_exclu:
-            if modexclu in self.liste_mod_maj_filename:
-                self.liste_mod_maj_filename.remove(modexclu)  # contient la liste des mods à mettre a jour avec les noms de fichier
+        mods_exclu = frozenset(self.mods_exclu)
+        # contient la liste des mods à mettre a jour avec les noms de fichier
+        self.liste_mod_maj_filename = [mod_file for mod_file in self.liste_complete_mods() if mod_file not in mods_exclu]
         for elem in self.liste_mod_maj_filename:
-            name = self.extract_modinfo(elem)[0]
-            self.mod_name_list.append(name[0])
+            self.mod_name_list.append(self.extract_modinfo(elem)[0])
 
     def update_mods(self):
         # Comparaison et maj des mods
         self.liste_mod_maj_filename.sort(key=lambda s: s.casefold())
-        for mod_maj in self.liste_mod_maj_filename:
-            modname_value = self.extract_modinfo(mod_maj)[0]
-            self.version_locale = self.extract_modinfo(mod_maj)[2]
-            modid_value = self.extract_modinfo(mod_maj)[1]
-            if modid_value == '':
-                modid_value = re.sub(r'\s', '', modname_value).lower()
-            filename_value = self.extract_modinfo(mod_maj)[4]
-            mod_url_api = f'{self.url_api}{modid_value}'
-            # On teste la validité du lien url
-            req = urllib.request.Request(str(mod_url_api))
-            try:
-                urllib.request.urlopen(req)  # On teste l'existence du lien
-                req_page = requests.get(str(mod_url_api), timeout=2)
-                resp_dict = req_page.json()
-                mod_asset_id = (resp_dict['mod']['assetid'])
-                self.mod_last_version_online = (resp_dict['mod']['releases'][0]['modversion'])
-                mod_file_onlinepath = (resp_dict['mod']['releases'][0]['mainfile'])
-                mod_prerelease_value = semver.Version.parse(self.mod_last_version_online)
-                # compare les versions des mods
-                print(f' [green]{modname_value[0].upper()}{modname_value[1:]}[/green]: {LanguageChoice().compver1} : {self.version_locale} - {LanguageChoice().compver2} : {self.mod_last_version_online}')
-                if self.disable_mod_dev == 'false' or mod_prerelease_value.prerelease is None:
-                    # On récupère les version du jeu nécessaire pour le mod (cad la version la plus basse necessaire)
-                    mod_game_versions = resp_dict['mod']['releases'][0]['tags']
-                    first_min_ver = None
-                    for ver in mod_game_versions:
-                        first_min_ver = ver.split('v', 1)[1]
-                    result_compversion_local = self.compversion_local(self.version_locale, self.mod_last_version_online)  # (version locale, version online)
-                    # On compare la version max souhaité à la version necessaire pour le mod
-                    result_game_compare_version = self.compversion_first_min_version(self.gamever_limit, first_min_ver)  # (version locale, version online,)
-                    if result_game_compare_version == -1 or result_game_compare_version == 0:  # On met à jour
-                        if result_compversion_local == -1 or (result_compversion_local == 0 and self.force_update.lower() == 'true'):
-                            dl_link = f'{LanguageChoice().url_mods}{mod_file_onlinepath}'
-                            resp = requests.get(str(dl_link), stream=True, timeout=2)
-                            file_size = int(resp.headers.get("Content-length"))
-                            file_size_mo = round(file_size / (1024 ** 2), 2)
-                            print(f'\t{LanguageChoice().compver3} : {file_size_mo} {LanguageChoice().compver3a}')
-                            print(f'\t[green] {modname_value} v.{self.mod_last_version_online}[/green] {LanguageChoice().compver4}')
-                            try:
-                                os.remove(filename_value)
-                            except PermissionError:
-                                print(f'[red]{LanguageChoice().error_msg}[/red]')
-                                msg_error = f'{filename_value} :\n\n\t {traceback.format_exc()}'
-                                write_log(msg_error)
-                                sys.exit()
-                            wget.download(dl_link, str(self.path_mods))  # debug
-                            self.Path_Changelog = f'https://mods.vintagestory.at/show/mod/{mod_asset_id}#tab-files'
-                            log_txt = self.get_changelog(self.Path_Changelog)  # On récupère le changelog
-                            content_lst_mods_updated = [
-                                self.version_locale,
-                                self.mod_last_version_online,
-                                log_txt
-                            ]
-                            self.mods_updated[modname_value] = content_lst_mods_updated
-                            print('\n')
-                            self.nb_maj += 1
-            except requests.exceptions.ReadTimeout:
-                write_log('ReadTimeout error: Server did not respond within the specified timeout.')
-            except urllib.error.URLError as err_url:
-                # Affiche de l'erreur si le lien n'est pas valide
-                print(f'[red]{LanguageChoice().error_msg}[/red]')
-                msg_error = f'{err_url.reason} : {modname_value}'
-                write_log(msg_error)
-            except Exception:
-                msg = f'{modname_value}\n{traceback.format_exc()}'
-                write_log(msg)
+        # On interroge l'API pour tous les mods en parallèle, les réponses sont ensuite traitées dans l'ordre
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            api_requests = {}
+            for mod_maj in self.liste_mod_maj_filename:
+                modname_value, modid_value = self.extract_modinfo(mod_maj)[0:2]
+                if modid_value == '':
+                    modid_value = RE_WHITESPACE.sub('', modname_value).lower()
+                api_requests[mod_maj] = executor.submit(self.get_mod_api, f'{self.url_api}{modid_value}')
+            # 1re vague : on compare les versions, les mods à mettre à jour sont téléchargés en parallèle
+            mods_to_update = []
+            for mod_maj in self.liste_mod_maj_filename:
+                modname_value, _, self.version_locale, _, filename_value = self.extract_modinfo(mod_maj)
+                try:
+                    resp_dict = api_requests[mod_maj].result()
+                    mod_asset_id = (resp_dict['mod']['assetid'])
+                    self.mod_last_version_online = (resp_dict['mod']['releases'][0]['modversion'])
+                    mod_file_onlinepath = (resp_dict['mod']['releases'][0]['mainfile'])
+                    mod_prerelease_value = semver_parse(self.mod_last_version_online)
+                    # compare les versions des mods
+                    print(f' [green]{modname_value[0].upper()}{modname_value[1:]}[/green]: {lang.compver1} : {self.version_locale} - {lang.compver2} : {self.mod_last_version_online}')
+                    if not self.disable_mod_dev or mod_prerelease_value.prerelease is None:
+                        # On récupère les version du jeu nécessaire pour le mod (cad la version la plus basse necessaire)
+                        mod_game_versions = resp_dict['mod']['releases'][0]['tags']
+                        first_min_ver = min((ver.split('v', 1)[1] for ver in mod_game_versions), key=lambda ver: tuple(int(num) for num in RE_VERSION_NUMBERS.findall(ver)), default=None)
+                        result_compversion_local = self.compversion_local(self.version_locale, self.mod_last_version_online)  # (version locale, version online)
+                        # On compare la version max souhaité à la version necessaire pour le mod
+                        result_game_compare_version = self.compversion_first_min_version(self.gamever_limit, first_min_ver)  # (version locale, version online,)
+                        if result_game_compare_version == -1 or result_game_compare_version == 0:  # On met à jour
+                            if result_compversion_local == -1 or (result_compversion_local == 0 and self.force_update):
+                                # On lance le téléchargement et la récupération du changelog
+                                dl_link = f'{lang.url_mods}{mod_file_onlinepath}'
+                                changelog_url = f'https://mods.vintagestory.at/show/mod/{mod_asset_id}#tab-files'
+                                mods_to_update.append([
+                                    modname_value,
+                                    self.version_locale,
+                                    self.mod_last_version_online,
+                                    filename_value,
+                                    executor.submit(self.download_mod, dl_link, mod_file_onlinepath, filename_value),
+                                    executor.submit(self.get_changelog, changelog_url)
+                                ])
+                except requests.exceptions.ReadTimeout:
+                    write_log('ReadTimeout error: Server did not respond within the specified timeout.')
+                except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err_url:
+                    # Affiche de l'erreur si le lien n'est pas valide
+                    log_error(f'{err_url} : {modname_value}')
+                except Exception:
+                    msg = f'{modname_value}\n{traceback.format_exc()}'
+                    write_log(msg)
+            # 2e vague : on affiche dans l'ordre le résultat des téléchargements
+            for num_mod, (modname_value, version_locale, version_online, filename_value, download, changelog) in enumerate(mods_to_update):
+                try:
+                    try:
+                        file_size, new_filename = download.result()
+                    except PermissionError:
+                        log_error(f'{filename_value} :\n\n\t {traceback.format_exc()}')
+                        # On annule les téléchargements pas encore lancés avant de quitter
+                        mods_remaining = mods_to_update[num_mod + 1:]
+                        for mod_remaining in mods_remaining:
+                            mod_remaining[4].cancel()
+                            mod_remaining[5].cancel()
+                        # Ceux déjà en cours vont jusqu'au bout : on les signale
+                        for modname_done, _, version_done, _, download_done, _ in mods_remaining:
+                            if not download_done.cancelled() and download_done.exception() is None:
+                                print(f'\t[green] {modname_done} v.{version_done}[/green] {lang.compver4}')
+                                write_log(f'{modname_done} : updated to v{version_done} before exiting')
+                        sys.exit()
+                    except Exception:
+                        # Le fichier .part a été effacé : l'ancienne version du mod reste installée
+                        print(f'\t[red]{modname_value} : {lang.download_failed} (v.{version_locale})[/red]\n')
+                        write_log(f'{modname_value} : download failed, kept v{version_locale}\n{traceback.format_exc()}')
+                        continue
+                    # Les infos en cache décrivent l'ancienne version : elles seront relues (pdf)
+                    self.modinfo_cache.pop(os.path.basename(filename_value), None)
+                    self.modinfo_cache.pop(new_filename, None)
+                    file_size_mo = round(file_size / (1024 ** 2), 2)
+                    print(f'\t{lang.compver3} : {file_size_mo} {lang.compver3a}')
+                    print(f'\t[green] {modname_value} v.{version_online}[/green] {lang.compver4}')
+                    log_txt = changelog.result()  # On récupère le changelog
+                    content_lst_mods_updated = [
+                        version_locale,
+                        version_online,
+                        log_txt
+                    ]
+                    self.mods_updated[modname_value] = content_lst_mods_updated
+                    print('\n')
+                    self.nb_maj += 1
+                except requests.exceptions.ReadTimeout:
+                    write_log('ReadTimeout error: Server did not respond within the specified timeout.')
+                except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err_url:
+                    # Affiche de l'erreur si le lien n'est pas valide
+                    log_error(f'{err_url} : {modname_value}')
+                except Exception:
+                    msg = f'{modname_value}\n{traceback.format_exc()}'
+                    write_log(msg)
+        self.http_cache.save()
 
     def resume(self):
         # Résumé de la maj
-        if self.nb_maj > 1:
-            print(f'  [yellow]{LanguageChoice().summary1}[/yellow] \n')
-            print(f'{LanguageChoice().summary2} :')
-            log_filename = f'updates_{dt.datetime.today().strftime("%Y%m%d_%H%M%S")}.txt'
-            if not self.path_logs.is_dir():
-                os.mkdir('logs')
-            log_path = Path(self.path_logs, log_filename)
-            with open(log_path, 'w', encoding='utf-8-sig') as logfile:
-                logfile.write(f'\n\t\t\tMods Vintage Story - {LanguageChoice().last_update} : {dt.datetime.today().strftime("%Y-%m-%d %H:%M:%S")}\n\n')
-                for modname, value in self.mods_updated.items():
-                    local_version = value[0]
-                    online_last_version = value[1]
-                    print(f' * [green]{modname} :[/green]')
-                    logfile.write(f'\n\n- {modname} : v{local_version} -> v{online_last_version} ({value[2]["url"]}) :\n')  # affiche en plus l'url du mod
-                    for log_version, log_txt in value[2].items():
-                        if log_version != 'url':
-                            print(f'\t[bold][yellow]Changelog {log_version} :[/yellow][/bold]')
-                            logfile.write(f'\tChangelog {log_version} :\n')
-                            for line in log_txt:
-                                print(f'\t\t[yellow]- {line}[/yellow]')
-                                logfile.write(f'\t\t- {line}\n')
-
-        elif self.nb_maj == 1:
-            print(f'  [yellow]{LanguageChoice().summary3}[/yellow] \n')
-            print(f'{LanguageChoice().summary4} :')
-            log_filename = f'updates_{dt.datetime.today().strftime("%Y%m%d_%H%M%S")}.txt'
-            if not self.path_logs.is_dir():
-                os.mkdir('logs')
-            log_path = Path(self.path_logs, log_filename)
+        if self.nb_maj:
+            if self.nb_maj > 1:
+                print(f'  [yellow]{lang.summary1}[/yellow] \n')
+                print(f'{lang.summary2} :')
+            else:
+                print(f'  [yellow]{lang.summary3}[/yellow] \n')
+                print(f'{lang.summary4} :')
+            now = time.localtime()
+            log_filename = f'updates_{time.strftime("%Y%m%d_%H%M%S", now)}.txt'
+            log_path = Path(get_logs_path(), log_filename)
             with open(log_path, 'w', encoding='utf-8-sig') as logfile:
-                logfile.write(
-                    f'\n\t\t\tMods Vintage Story - {LanguageChoice().last_update} : {dt.datetime.today().strftime("%Y-%m-%d %H:%M:%S")}\n\n')
-                for modname, value in self.mods_updated.items():
-                    local_version = value[0]
-                    online_last_version = value[1]
+                logfile.write(f'\n\t\t\tMods Vintage Story - {lang.last_update} : {time.strftime("%Y-%m-%d %H:%M:%S", now)}\n\n')
+                for modname, (local_version, online_last_version, changelog) in self.mods_updated.items():
+                    # Copie du changelog (il peut venir du cache) pour en retirer l'url
+                    changelog = dict(changelog)
+                    mod_url = changelog.pop('url', '')
                     print(f' * [green]{modname} :[/green]')
-                    logfile.write(f'\n\n- {modname} : v{local_version} -> v{online_last_version} ({value[2]["url"]}) :\n')  # affiche en plus l'url du mod
-                    for log_version, log_txt in value[2].items():
-                        if log_version != 'url':
-                            print(f'\t[bold][yellow]Changelog {log_version} :[/yellow][/bold]')
-                            logfile.write(f'\tChangelog {log_version} :\n')
-                            for line in log_txt:
-                                print(f'\t\t[yellow]- {line}[/yellow]')
-                                logfile.write(f'\t\t- {line}\n')
+                    logfile.write(f'\n\n- {modname} : v{local_version} -> v{online_last_version} ({mod_url}) :\n')  # affiche en plus l'url du mod
+                    for log_version, log_txt in changelog.items():
+                        print(f'\t[bold][yellow]Changelog {log_version} :[/yellow][/bold]')
+                        logfile.write(f'\tChangelog {log_version} :\n')
+                        for line in log_txt:
+                            CONSOLE_TXT.print(f'\t\t- {line}', style='yellow')
+                            logfile.write(f'\t\t- {line}\n')
         else:
-            print(f'  [yellow]{LanguageChoice().summary5}[/yellow]\n')
+            print(f'  [yellow]{lang.summary5}[/yellow]\n')
 
         if len(self.mods_exclu) == 1:
             modinfo_values = self.extract_modinfo(self.mods_exclu[0])
-            print(f'\n {LanguageChoice().summary6} :\n - [red]{modinfo_values[0]} [italic](v.{modinfo_values[2]})[italic][/red]')
+            if modinfo_values is None:  # modinfo.json illisible : on affiche le nom du fichier
+                print(f'\n {lang.summary6} :\n - [red]{self.mods_exclu[0]}[/red]')
+            else:
+                print(f'\n {lang.summary6} :\n - [red]{modinfo_values[0]} [italic](v.{modinfo_values[2]})[italic][/red]')
         if len(self.mods_exclu) > 1:
-            print(f'\n {LanguageChoice().summary7} :')
+            print(f'\n {lang.summary7} :')
             for k in range(0, len(self.mods_exclu)):
                 # On appelle la fonction pour extraire modinfo.json
                 modinfo_values = self.extract_modinfo(self.mods_exclu[k])
-                print(f' - [red]{modinfo_values[0]} v.{modinfo_values[2]}[/red]')
+                if modinfo_values is None:
+                    print(f' - [red]{self.mods_exclu[k]}[/red]')
+                else:
+                    print(f' - [red]{modinfo_values[0]} v.{modinfo_values[2]}[/red]')
 
 
 # Création du pdf.
 class GetInfo:
-    def __init__(self, mod_name, mod_id, mod_moddesc, mod_filepath):
-        # path
-        self.csvfile = Path('temp', 'csvtemp.csv')
+    api_url = 'https://mods.vintagestory.at/api/mod/'
+
+    def __init__(self, mod_name, mod_id, mod_moddesc, mod_filepath, path_png):
+        # path (le dossier des icônes est créé une seule fois avant de lancer les mods)
         self.filepath = mod_filepath
-        self.path_temp = 'temp'
-        self.path_png = Path('temp', 'png')
+        self.path_png = path_png
         self.path_modicon = None
-        self.path_url = 'https://mods.vintagestory.at/'
-        self.api_url = 'https://mods.vintagestory.at/api/mod/'
-        # dico
-        self.modsinfo_dic = {}
-        # list
-        self.moddesc_lst = []
         # var
         self.mod_moddesc = mod_moddesc
         self.mod_name = mod_name
         self.mod_url = None
         self.mod_id = mod_id
-        self.modinfo_content = None
         self.test_url_mod = ''
 
     def get_infos(self):
-        # extraction modicon.png et renommage avec modid
+        # extraction de modicon.png directement sous le nom modid.png
         if zipfile.is_zipfile(self.filepath):
-            archive = zipfile.ZipFile(self.filepath, 'r')
-            try:
-                archive.extract('modicon.png', self.path_png)
-                png_name = f'{self.mod_id}.png'
-                self.path_modicon = Path(self.path_png, png_name)
+            with zipfile.ZipFile(self.filepath, 'r') as archive:
                 try:
-                    os.rename(Path(self.path_png, 'modicon.png'), self.path_modicon)
-                except FileExistsError:
+                    with archive.open('modicon.png') as modicon:
+                        path_modicon = Path(self.path_png, f'{self.mod_id}.png')
+                        with open(path_modicon, 'wb') as png_file:
+                            shutil.copyfileobj(modicon, png_file, 1 << 16)
+                    self.path_modicon = path_modicon
+                except KeyError:
                     pass
-            except KeyError:
-                pass
-            zipfile.ZipFile.close(archive)
         self.mod_url = self.get_url(self.mod_id)
-        self.moddesc_lst.append(self.mod_moddesc)
-        self.moddesc_lst.append(self.mod_url)
-        self.moddesc_lst.append(self.path_modicon)
-        self.modsinfo_dic[self.mod_name] = self.moddesc_lst
-        # On crée le csv
-        with open(self.csvfile, "a", encoding="UTF-8", newline='') as fichier:
-            objet_csv = csv.writer(fichier)
-            for items in self.modsinfo_dic:
-                objet_csv.writerow([items, self.modsinfo_dic[items][0], self.modsinfo_dic[items][1], self.modsinfo_dic[items][2]])
-        return self.modsinfo_dic
+        # Ligne du tableau du pdf : nom, description, lien, icone
+        path_modicon = str(self.path_modicon) if self.path_modicon else ''
+        return [self.mod_name, self.mod_moddesc or '', self.mod_url or '', path_modicon]
 
     def get_url(self, modid):
         url = os.path.join(self.api_url, modid)
-        req = urllib.request.Request(url)
         try:
-            urllib.request.urlopen(req)  # On teste l'existence du lien
-            req_page = requests.get(url, timeout=2)
+            req_page = SESSION.get(url, timeout=2)
+            req_page.raise_for_status()  # On teste l'existence du lien
             resp_dict = req_page.json()
             mod_asset_id = str(resp_dict['mod']['assetid'])
             mod_urlalias = str(resp_dict['mod']['urlalias'])
@@ -787,44 +970,38 @@ class GetInfo:
             return self.test_url_mod
         except requests.exceptions.ReadTimeout:
             write_log('ReadTimeout error: Server did not respond within the specified timeout.')
-        except urllib.error.URLError as err_url:
+        except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err_url:
             # Affiche de l'erreur si le lien n'est pas valide
-            print(f'[red]{LanguageChoice().error_msg}[/red]')
-            msg_error = f'{err_url.reason} : {self.test_url_mod}'
-            write_log(msg_error)
+            log_error(f'{err_url} : {url}')
         except KeyError:
-            print(f'[red]{LanguageChoice().error_msg}[/red]')
-            msg_error = traceback.format_exc()
-            write_log(msg_error)
+            log_error(traceback.format_exc())
             sys.exit()
 
 
 class MakePdf:
     def __init__(self):
-        self.langchoice = LanguageChoice()
         # var temps
-        self.current_dateTime = datetime.now()
-        self.date_dl = self.current_dateTime.strftime("%Y-%m-%d %H:%M")
-        self.annee = self.current_dateTime.strftime("%Y")
-        self.mois = self.current_dateTime.strftime("%m")
-        self.jour = self.current_dateTime.strftime("%d")
-        # path
-        self.csvfile = Path('temp', 'csvtemp.csv')
-
-    def makepdf(self):
+        self.date_pdf = time.strftime("%Y_%m_%d")
+
+    @staticmethod
+    def new_pdf():
+        # Document vierge avec les polices et la mise en page (réglages faits une seule fois, avant la 1ere page)
+        monpdf = FPDF('P', 'mm', 'A4')
+        monpdf.add_font('FreeSans', '', str(Path('font', 'FreeSans.ttf')))
+        monpdf.add_font('FreeSansBold', '', str(Path('font', 'FreeSansBold.ttf')))
+        monpdf.set_top_margin(10)
+        monpdf.set_auto_page_break(True, margin=10)
+        monpdf.set_page_background((200, 215, 150))
+        monpdf.oversized_images = "DOWNSCALE"
+        monpdf.oversized_images_ratio = 5
+        return monpdf
+
+    def makepdf(self, table_data):
         try:
             # On crée le pdf
-            monpdf = FPDF('P', 'mm', 'A4')
-            monpdf.add_font('FreeSans', '', str(Path('font', 'FreeSans.ttf')))
-            monpdf.add_font('FreeSansBold', '', str(Path('font', 'FreeSansBold.ttf')))
-            margintop_page = 10
-            monpdf.set_top_margin(margintop_page)
-            monpdf.set_auto_page_break(True, margin=10)
-            monpdf.set_page_background((200, 215, 150))
+            monpdf = self.new_pdf()
             monpdf.add_page(same=True)
-            nom_fichier_pdf = f'VS_Mods_{self.annee}_{self.mois}_{self.jour}.pdf'
-            monpdf.oversized_images = "DOWNSCALE"
-            monpdf.oversized_images_ratio = 5
+            nom_fichier_pdf = f'VS_Mods_{self.date_pdf}.pdf'
             width_img = 180
             x = (210-width_img)/2
             monpdf.image('banner.png', x=x, y=5, w=width_img)
@@ -832,13 +1009,7 @@ class MakePdf:
             monpdf.set_font("FreeSansBold", '', size=20)
             monpdf.set_text_color(0, 0, 0)  # Couleur RGB pour le titre
             monpdf.set_y(45)
-            monpdf.cell(w=0, h=20, text=f'{self.langchoice.pdfTitle}', border=0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C", fill=False)
-            table_data = []
-            # On remplit la liste table_data
-            with open(self.csvfile, newline='') as csv_file:
-                reader = csv.reader(csv_file, delimiter=',')
-                for ligne in reader:
-                    table_data.append(ligne)
+            monpdf.cell(w=0, h=20, text=f'{lang.pdfTitle}', border=0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C", fill=False)
             with monpdf.table(first_row_as_headings=False,
                               line_height=5,
                               width=190,
@@ -854,9 +1025,7 @@ class MakePdf:
                     monpdf.set_font("FreeSans", '', size=7)
                     row.cell(ligne[1])
         except Exception:
-            print(f'[red]{LanguageChoice().error_msg}[/red]')
-            msg_error = traceback.format_exc()
-            write_log(msg_error)
+            log_error(traceback.format_exc())
             sys.exit()
 
         try:
@@ -866,10 +1035,6 @@ class MakePdf:
             print(f'[red]{lang.ErrorCreationPDF}[/red]')
 
 
-# On récupère le system
-my_os = platform.system()
-
-
 # Définitions des arguments
 argParser = argparse.ArgumentParser()
 argParser.add_argument("--modspath", help='Enter the mods directory (in quotes).', required=False, type=pathlib.Path)
@@ -878,6 +1043,7 @@ argParser.add_argument("--nopause", help="Disable the pause at the end of the sc
 argParser.add_argument("--exclusion", help="Write filenames of mods with extension (in quotes) you want to exclude (each mod separated by space).", nargs="+")
 argParser.add_argument("--forceupdate", help="Force ModsUpdater to download the latest versions for ALL the mods (default=false).", choices=['false', 'true'], type=str.lower, required=False, default='false')
 argParser.add_argument("--makepdf", help="Create,at the end of the Update, a PDF file of all mods in the mods folder (default=false).", choices=['false', 'true'], type=str.lower, required=False, default='false')
+argParser.add_argument("--nocache", help="Do not use or save the cache of the ModDB answers (default=false).", choices=['false', 'true'], type=str.lower, required=False, default='false')
 argParser.add_argument("--disable_mod_dev", help="enable or disable the update of mods in dev or prerelease (true/false default=false)", choices=['false', 'true'], type=str.lower, required=False)
 args = argParser.parse_args()
 # Fin des arguments
@@ -900,22 +1066,13 @@ def datapath():
 # On récupère l'argument modspath
 def arg_modspath():
     # On vérifie si le chemin contient des variables d'environnement
-    path_mods_raw = Path(args.modspath)
+    path_mods_raw = args.modspath  # déjà un Path (type de l'argument)
     # On vérifie si la variable %appdata% (ou HOME) est dans le chemin et on la remplace par la variable systeme.
-    if my_os == 'Windows':
-        regex_path_mods = r'(%APPDATA%)(.*)'
-        var_env = os.getenv('appdata')
-    elif my_os == 'Linux':
-        regex_path_mods = r'(HOME)(.*)'
-        var_env = os.getenv('HOME')
-    else:
-        regex_path_mods = None
-        var_env = None
-    result_path_mods = re.search(regex_path_mods, str(path_mods_raw), flags=re.IGNORECASE)
+    result_path_mods = RE_PATH_MODS.search(str(path_mods_raw)) if RE_PATH_MODS else None
     if result_path_mods:
         part2 = result_path_mods.group(2)
         part2 = part2[1:]  # On retire le 1er charactere (\ ou /)
-        arg_path_mods = Path(var_env, part2)
+        arg_path_mods = Path(VAR_ENV, part2)
     else:
         arg_path_mods = path_mods_raw
     return arg_path_mods
@@ -925,32 +1082,29 @@ def arg_modspath():
 if args.modspath:
     path_mods = arg_modspath()
 else:
-    if my_os == 'Windows':
-        # On cherche les versions installées de Vintage Story
-        path_mods = Path(os.getenv('appdata'), 'VintagestoryData', 'Mods')
-    elif my_os == 'Linux':
-        path_mods = Path(Path.home(), '.config', 'VintagestoryData', 'Mods')
-    else:
-        path_mods = None
+    # Dossier par défaut de Vintage Story selon le system
+    path_mods = PATH_MODS_DEFAULT
 
 # Charge le chemin du dossier data de VS à partir du config.ini si il exsite
-config_path = Path(Path.cwd(), 'config.ini')
+config_path = PATH_CONFIG_FILE
 config_make_pdf = None
-if not Path(config_path).is_file():
+if not config_file_exists(config_path):
     if not args.modspath:
-        while not path_mods.is_dir():
+        while not os.path.isdir(path_mods):
             path_mods = datapath()
 else:
     # On charge le fichier config.ini si --modspath non donné
     if not args.modspath:
         config_read = configparser.ConfigParser(allow_no_value=True, interpolation=None)
-        config_read.read('config.ini', encoding='utf-8-sig')
+        config_read.read(PATH_CONFIG_FILE, encoding='utf-8-sig')
         config_path = config_read.get('ModPath', 'path')
         path_mods = Path(config_path)
     else:
         path_mods = arg_modspath()
 
-if path_mods.is_dir():
+# Le test du dossier des mods sert aussi pour le pdf (inst n'existe que si le dossier existe)
+path_mods_ok = os.path.isdir(path_mods)
+if path_mods_ok:
     inst = VSUpdate(path_mods)
     inst.accueil()
     inst.mods_exclusion()
@@ -960,43 +1114,48 @@ if path_mods.is_dir():
 
 # Création du pdf (si argument nopause est false)
 if args.nopause == 'false' or args.makepdf == 'true':
-    make_pdf = None
     if args.makepdf == 'false':
-        while make_pdf not in {str(LanguageChoice().yes).lower(), str(LanguageChoice().yes[0]).lower(), str(LanguageChoice().no).lower(), str(LanguageChoice().no[0]).lower()}:
-            make_pdf = Prompt.ask(f'{LanguageChoice().makepdf}', choices=[LanguageChoice().list_yesno[0], LanguageChoice().list_yesno[1], LanguageChoice().list_yesno[2], LanguageChoice().list_yesno[3]])
+        # Prompt.ask redemande tant que la réponse n'est pas dans choices
+        make_pdf = Prompt.ask(f'{lang.makepdf}', choices=lang.list_yesno)
     else:
-        make_pdf = str(LanguageChoice().yes).lower()
-    if make_pdf == str(LanguageChoice().yes).lower() or make_pdf == str(LanguageChoice().yes[0]).lower():
+        make_pdf = lang.list_yesno[0]
+    if make_pdf in lang.set_yes:
         # Construction du titre
         asterisk = '*'
-        nb_asterisk = len(LanguageChoice().makePDFTitle) + 4
+        nb_asterisk = len(lang.makePDFTitle) + 4
         string_asterisk = asterisk * nb_asterisk
         print(f'\t[green]{string_asterisk}[/green]')
-        print(f'\t[green]* {LanguageChoice().makePDFTitle} *[/green]')
+        print(f'\t[green]* {lang.makePDFTitle} *[/green]')
         print(f'\t[green]{string_asterisk}[/green]')
 
-        # uniquement pour avoir le nb de mods (plus rapide car juste listing)
-        nb_mods = 0
-        nb_mods_ok = 0
+        # Liste des mods en un seul passage dans le dossier
+        mod_files = []
+        if path_mods_ok:
+            mod_files = [entry.name for entry in list_files(path_mods, ('.zip', '.cs'))]
         print('\n')
-        mod_file_path = Path(path_mods, '*.*')
-        for mod in glob.glob(str(mod_file_path)):
-            if os.path.splitext(mod)[1] == '.zip' or os.path.splitext(mod)[1] == '.cs':
-                nb_mods += 1
-        for modfilepath in glob.glob(str(mod_file_path)):
-            if os.path.splitext(modfilepath)[1] == '.zip' or os.path.splitext(modfilepath)[1] == '.cs':
-                nb_mods_ok += 1
-                info_content = VSUpdate(modfilepath).extract_modinfo(modfilepath)
-                GetInfo(info_content[0], info_content[1], info_content[3], info_content[4]).get_infos()
-                print(f'\t\t{LanguageChoice().addingmodsinprogress} {nb_mods_ok}/{nb_mods}', end="\r")
+        path_png = ensure_dir(Path(get_temp_path(), 'png'))
+        # Les infos en ligne et les icônes des mods sont récupérées en parallèle
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            mods_getinfo = []
+            for mod_file in mod_files:
+                # modinfo déjà lu lors de la maj
+                info_content = inst.extract_modinfo(mod_file)
+                if info_content is None:  # modinfo.json illisible : le mod n'est pas ajouté au pdf
+                    continue
+                mods_getinfo.append(executor.submit(GetInfo(info_content[0], info_content[1], info_content[3], info_content[4], path_png).get_infos))
+            nb_mods = len(mods_getinfo)
+            # Les lignes du tableau restent en mémoire jusqu'à la création du pdf
+            table_data = []
+            for nb_mods_ok, mod_getinfo in enumerate(mods_getinfo, 1):
+                table_data.append(mod_getinfo.result())
+                print(f'\t\t{lang.addingmodsinprogress} {nb_mods_ok}/{nb_mods}', end="\r")
         pdf = MakePdf()
-        pdf.makepdf()
+        pdf.makepdf(table_data)
         if args.makepdf == 'false':
-            input(f'{LanguageChoice().exiting_script}')
-    elif make_pdf == str(lang.no).lower() or make_pdf == str(LanguageChoice().no[0]).lower():
-        print(f'{LanguageChoice().end_of_prg} ')
+            input(f'{lang.exiting_script}')
+    elif make_pdf in lang.set_no:
+        print(f'{lang.end_of_prg} ')
         time.sleep(2)
 
 # On efface le dossier temp
-if Path('temp').is_dir():
-    shutil.rmtree('temp')
+clear_temp_folder()